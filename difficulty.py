@@ -4,7 +4,8 @@ Difficulty presets for Minisweeper.
 
 Provides a simple API:
 - get_difficulty(name) -> Difficulty
-- list_difficulties() -> dict[name, Difficulty]
+- list_difficulties() -> read-only mapping of name -> Difficulty
+- difficulty_names() -> sorted tuple of names
 - normalize_name(name) -> canonical key
 
 Levels:
@@ -15,7 +16,8 @@ Levels:
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 
 @dataclass(frozen=True)
@@ -32,6 +34,8 @@ _LEVELS: Dict[str, Difficulty] = {
     "hard": Difficulty("hard", 30, 16, 99),
     "too hard": Difficulty("too hard", 30, 24, 180),
 }
+_LEVELS_RO: Mapping[str, Difficulty] = MappingProxyType(_LEVELS)
+_NAMES_SORTED: Tuple[str, ...] = tuple(sorted(_LEVELS))
 
 
 def normalize_name(name: str) -> str:
@@ -42,11 +46,18 @@ def normalize_name(name: str) -> str:
 
 
 def get_difficulty(name: str) -> Difficulty:
+    # Fast path: canonical names (e.g. from the GUI combobox) need no normalizing
+    if name in _LEVELS:
+        return _LEVELS[name]
     key = normalize_name(name)
     if key not in _LEVELS:
-        raise ValueError(f"Unknown difficulty: {name}. Available: {', '.join(sorted(_LEVELS))}")
+        raise ValueError(f"Unknown difficulty: {name}. Available: {', '.join(_NAMES_SORTED)}")
     return _LEVELS[key]
 
 
-def list_difficulties() -> Dict[str, Difficulty]:
-    return dict(_LEVELS)
+def list_difficulties() -> Mapping[str, Difficulty]:
+    return _LEVELS_RO
+
+
+def difficulty_names() -> Tuple[str, ...]:
+    return _NAMES_SORTED
@@ -12,10 +12,10 @@ from __future__ import annotations
 import argparse
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Tuple
+from typing import Dict, Set, Tuple
 
-from minisweeper import Board
-from difficulty import get_difficulty, list_difficulties
+from minisweeper import ADJ_SHIFT, FLAGGED, MINE, REVEALED, Board
+from difficulty import difficulty_names, get_difficulty
 
 # UI constants
 GAME_OVER_TITLE = "Game Over"
@@ -23,17 +23,23 @@ WIN_TITLE = "You Win!"
 MINE_HIT_MSG = "Boom! You hit a mine."
 WIN_MSG = "All safe cells revealed."
 
+# Board canvas geometry
+CELL = 28  # pixel size of one cell, including its 1px gap
+CELL_FONT = ("Segoe UI", 12, "bold")
 
-NUM_COLORS = {
-    1: "#1976d2",  # blue
-    2: "#388e3c",  # green
-    3: "#d32f2f",  # red
-    4: "#7b1fa2",  # purple
-    5: "#5d4037",  # brown
-    6: "#0097a7",  # cyan-ish
-    7: "#455a64",  # blue grey
-    8: "#000000",  # black
-}
+
+# Indexed by adjacent mine count (0-8)
+NUM_COLORS = (
+    "#000",     # unused: zero cells show no number
+    "#1976d2",  # blue
+    "#388e3c",  # green
+    "#d32f2f",  # red
+    "#7b1fa2",  # purple
+    "#5d4037",  # brown
+    "#0097a7",  # cyan-ish
+    "#455a64",  # blue grey
+    "#000000",  # black
+)
 
 
 class MinesweeperApp(tk.Tk):
@@ -43,7 +49,10 @@ class MinesweeperApp(tk.Tk):
         self.resizable(False, False)
 
         self.board: Board | None = None
-        self.buttons: Dict[Tuple[int, int], tk.Button] = {}
+        self.rect_ids: Dict[Tuple[int, int], int] = {}
+        self.text_ids: Dict[Tuple[int, int], int] = {}
+        # cells whose canvas items are out of date with the board
+        self._dirty: Set[Tuple[int, int]] = set()
         self.game_over: bool = False
 
         # Top controls
@@ -53,7 +62,7 @@ class MinesweeperApp(tk.Tk):
         # Difficulty chooser
         ttk.Label(top, text="Difficulty:").grid(row=0, column=0, padx=(0, 4))
         self.diff_var = tk.StringVar(value="custom")
-        diff_values = ["custom"] + sorted(list_difficulties().keys())
+        diff_values = ["custom", *difficulty_names()]
         self.diff_combo = ttk.Combobox(
             top, textvariable=self.diff_var, values=diff_values, width=10, state="readonly"
         )
@@ -82,9 +91,24 @@ class MinesweeperApp(tk.Tk):
         status = ttk.Label(self, textvariable=self.status_var, padding=(8, 0))
         status.grid(row=2, column=0, sticky="w")
 
-        # Board frame
+        # Board frame: a single canvas holds every cell as rectangle + text items
         self.board_frame = ttk.Frame(self, padding=(8, 8))
         self.board_frame.grid(row=1, column=0)
+        self.canvas = tk.Canvas(
+            self.board_frame,
+            width=width * CELL,
+            height=height * CELL,
+            highlightthickness=0,
+            borderwidth=0,
+        )
+        self.canvas.grid(row=0, column=0)
+        # Left click reveal
+        self.canvas.bind("<Button-1>", self._on_left)
+        # Right click flag (support Button-2 for some platforms)
+        self.canvas.bind("<Button-3>", self._on_right)
+        self.canvas.bind("<Button-2>", self._on_right)
+        # Double-click chord (optional convenience)
+        self.canvas.bind("<Double-Button-1>", self._on_double)
 
         self.new_game(width, height, mines)
 
@@ -139,46 +163,55 @@ class MinesweeperApp(tk.Tk):
     # --- UI construction ---
     def _build_grid(self):
         # Clear previous
-        for child in self.board_frame.winfo_children():
-            child.destroy()
-        self.buttons.clear()
+        self.canvas.delete("all")
+        self.rect_ids.clear()
+        self.text_ids.clear()
 
         assert self.board is not None
+        self.canvas.config(width=self.board.w * CELL, height=self.board.h * CELL)
         for y in range(self.board.h):
             for x in range(self.board.w):
-                btn = tk.Button(
-                    self.board_frame,
-                    text="",
-                    width=2,
-                    height=1,
-                    font=("Segoe UI", 12, "bold"),
-                    relief=tk.RAISED,
+                x0, y0 = x * CELL, y * CELL
+                self.rect_ids[(x, y)] = self.canvas.create_rectangle(
+                    x0 + 1, y0 + 1, x0 + CELL - 1, y0 + CELL - 1,
+                    fill="#e0e0e0", outline="#9e9e9e", width=1,
                 )
-                btn.grid(row=y, column=x, padx=1, pady=1, sticky="nsew")
-                # Left click reveal
-                btn.bind("<Button-1>", lambda e, x=x, y=y: self.on_left_click(x, y))
-                # Right click flag (support Button-2 for some platforms)
-                btn.bind("<Button-3>", lambda e, x=x, y=y: self.on_right_click(x, y))
-                btn.bind("<Button-2>", lambda e, x=x, y=y: self.on_right_click(x, y))
-                # Double-click chord (optional convenience)
-                btn.bind("<Double-Button-1>", lambda e, x=x, y=y: self.on_chord(x, y))
-                self.buttons[(x, y)] = btn
-
-        # Make columns/rows expand evenly inside board_frame (optional visual)
-        for x in range(self.board.w):
-            self.board_frame.grid_columnconfigure(x, weight=1)
-        for y in range(self.board.h):
-            self.board_frame.grid_rowconfigure(y, weight=1)
+        # Cells start out drawn as covered; labels are created on first use
+        self._dirty.clear()
 
         self._refresh_cells()
 
+    def _cell_at(self, event) -> Tuple[int, int] | None:
+        # Map a canvas click to the cell under the pointer
+        if self.board is None:
+            return None
+        x = int(self.canvas.canvasx(event.x) // CELL)
+        y = int(self.canvas.canvasy(event.y) // CELL)
+        return (x, y) if self.board.in_bounds(x, y) else None
+
+    def _on_left(self, event):
+        xy = self._cell_at(event)
+        if xy is not None:
+            self.on_left_click(*xy)
+
+    def _on_right(self, event):
+        xy = self._cell_at(event)
+        if xy is not None:
+            self.on_right_click(*xy)
+
+    def _on_double(self, event):
+        xy = self._cell_at(event)
+        if xy is not None:
+            self.on_chord(*xy)
+
     # --- Events ---
     def on_left_click(self, x: int, y: int):
         if self.game_over or self.board is None:
             return
-        cell = self.board.grid[y][x]
+        i = self.board.index(x, y)
         ok, hit = self.board.reveal(x, y)
-        if not ok and cell.revealed and not cell.mine:
+        self._dirty.update(self.board.last_revealed)
+        if not ok and self.board.state[i] & (REVEALED | MINE) == REVEALED:
             # Treat click on number as chord attempt
             self.on_chord(x, y)
             return
@@ -200,32 +233,40 @@ class MinesweeperApp(tk.Tk):
         if self.game_over or self.board is None:
             return
         if self.board.toggle_flag(x, y):
+            self._dirty.add((x, y))
             self._refresh_cells()
             self._update_status()
 
     def on_chord(self, x: int, y: int):
         if self.game_over or self.board is None:
             return
-        c = self.board.grid[y][x]
-        if not c.revealed or c.adj <= 0:
+        b = self.board
+        s = b.state[b.index(x, y)]
+        adj = s >> ADJ_SHIFT
+        if not s & REVEALED or adj <= 0:
             return
+        # Count flags and collect covered neighbors in one pass
         flagged = 0
-        for nx, ny in self.board.neighbors(x, y):
-            if self.board.grid[ny][nx].flagged:
+        to_reveal = []
+        for nx, ny in b.neighbors(x, y):
+            ns = b.state[b.index(nx, ny)]
+            if ns & FLAGGED:
                 flagged += 1
-        if flagged != c.adj:
+            elif not ns & REVEALED:
+                to_reveal.append((nx, ny))
+        if flagged != adj:
             return
-        # Reveal all neighboring non-flagged cells
-        for nx, ny in self.board.neighbors(x, y):
-            ncell = self.board.grid[ny][nx]
-            if not ncell.flagged and not ncell.revealed:
-                _, hit = self.board.reveal(nx, ny)
-                if hit:
-                    self.game_over = True
-                    self._reveal_all()
-                    self._refresh_cells()
-                    messagebox.showinfo(GAME_OVER_TITLE, MINE_HIT_MSG)
-                    return
+        # Reveal all neighboring non-flagged cells; ones already uncovered by an
+        # earlier flood fill in this loop are a no-op
+        for nx, ny in to_reveal:
+            _, hit = b.reveal(nx, ny)
+            self._dirty.update(b.last_revealed)
+            if hit:
+                self.game_over = True
+                self._reveal_all()
+                self._refresh_cells()
+                messagebox.showinfo(GAME_OVER_TITLE, MINE_HIT_MSG)
+                return
         if self.board.all_safe_revealed():
             self.game_over = True
             self._reveal_all()
@@ -236,50 +277,61 @@ class MinesweeperApp(tk.Tk):
 
     # --- Rendering ---
     def _reveal_all(self):
-        # Only affects rendering; Board already exposes data
-        pass  # nothing needed; _refresh_cells reads from board state
+        # Only affects rendering; every cell may change once mines are shown
+        self._dirty = set(self.rect_ids)
 
     def _refresh_cells(self):
-        assert self.board is not None
-        for y in range(self.board.h):
-            for x in range(self.board.w):
-                btn = self.buttons[(x, y)]
-                c = self.board.grid[y][x]
-                if self.game_over:
-                    # Show mines and final state
-                    if c.mine:
-                        btn.config(text="*", fg="#000", bg="#ffcccb", relief=tk.SUNKEN, state=tk.DISABLED)
-                    else:
-                        self._render_safe_cell(btn, c)
+        b = self.board
+        assert b is not None
+        # Work out every cell's new look first, then push all canvas changes
+        # in one batch and flush them with a single idle-task pass.
+        paints = []
+        for x, y in self._dirty:
+            s = b.state[b.index(x, y)]
+            if self.game_over:
+                # Show mines and final state
+                if s & MINE:
+                    paints.append((x, y, "*", "#000", "#ffcccb"))
                 else:
-                    if c.flagged and not c.revealed:
-                        btn.config(text="F", fg="#d32f2f", bg="#ffe0b2", relief=tk.RAISED, state=tk.NORMAL)
-                    elif not c.revealed:
-                        btn.config(text="", fg="#000", bg="#e0e0e0", relief=tk.RAISED, state=tk.NORMAL)
-                    else:
-                        self._render_safe_cell(btn, c)
+                    paints.append((x, y, *self._safe_cell_look(s)))
+            else:
+                if s & FLAGGED and not s & REVEALED:
+                    paints.append((x, y, "F", "#d32f2f", "#ffe0b2"))
+                elif not s & REVEALED:
+                    paints.append((x, y, "", "#000", "#e0e0e0"))
+                else:
+                    paints.append((x, y, *self._safe_cell_look(s)))
+        self._dirty.clear()
+        for paint in paints:
+            self._paint(*paint)
         self._update_status()
-
-    def _render_safe_cell(self, btn: tk.Button, cell):
-        if cell.mine:
-            btn.config(text="*", fg="#000", bg="#ffcccb", relief=tk.SUNKEN, state=tk.DISABLED)
-            return
-        if cell.adj == 0:
-            btn.config(text="", fg="#000", bg="#cfd8dc", relief=tk.SUNKEN, state=tk.DISABLED)
-        else:
-            color = NUM_COLORS.get(cell.adj, "#000")
-            btn.config(text=str(cell.adj), fg=color, bg="#cfd8dc", relief=tk.SUNKEN, state=tk.DISABLED)
+        if paints:
+            self.update_idletasks()
+
+    def _paint(self, x: int, y: int, text: str, fg: str, bg: str):
+        self.canvas.itemconfigure(self.rect_ids[(x, y)], fill=bg)
+        text_id = self.text_ids.get((x, y))
+        if text_id is not None:
+            self.canvas.itemconfigure(text_id, text=text, fill=fg)
+        elif text:
+            self.text_ids[(x, y)] = self.canvas.create_text(
+                x * CELL + CELL // 2, y * CELL + CELL // 2, text=text, fill=fg, font=CELL_FONT
+            )
+
+    def _safe_cell_look(self, s: int) -> Tuple[str, str, str]:
+        # (text, fg, bg) for a revealed cell
+        adj = s >> ADJ_SHIFT
+        if s & MINE:
+            return "*", "#000", "#ffcccb"
+        if adj == 0:
+            return "", "#000", "#cfd8dc"
+        return str(adj), NUM_COLORS[adj] if adj < 9 else "#000", "#cfd8dc"
 
     def _update_status(self):
         if self.board is None:
             self.status_var.set("")
             return
-        flags = sum(
-            1
-            for y in range(self.board.h)
-            for x in range(self.board.w)
-            if self.board.grid[y][x].flagged
-        )
+        flags = self.board.flag_count
         rem = max(0, self.board.mine_target - flags)
         state = GAME_OVER_TITLE if self.game_over else "Playing"
         self.status_var.set(
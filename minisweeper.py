@@ -16,21 +16,78 @@ Coordinates are 0-indexed. x is column, y is row.
 from __future__ import annotations
 import argparse
 import random
-from dataclasses import dataclass
-from typing import List, Tuple, Iterable
-from difficulty import get_difficulty, list_difficulties
+from typing import List, Optional, Tuple
+from difficulty import difficulty_names, get_difficulty
 
 
-@dataclass
-class Cell:
-    mine: bool = False
-    revealed: bool = False
-    flagged: bool = False
-    adj: int = 0  # adjacent mines
+# Cell state bits, packed into one byte per cell
+MINE = 0x01
+REVEALED = 0x02
+FLAGGED = 0x04
+ADJ_SHIFT = 3  # bits 3-6 hold the adjacent mine count (0-8)
+ADJ_MASK = 0x78
+
+
+def flood_fill(state: bytearray, w: int, h: int, sx: int, sy: int) -> List[int]:
+    """Reveal outward from the zero cell (sx, sy), which is already revealed.
+
+    Stops at revealed, flagged and mine cells, and only spreads on from
+    cells with no adjacent mines. Works on the flat state bytes directly
+    and returns the indices it newly revealed.
+    """
+    blocked = REVEALED | FLAGGED | MINE
+    newly: List[int] = []
+    stack = [sy * w + sx]
+    while stack:
+        cy, cx = divmod(stack.pop(), w)
+        for ny in range(max(cy - 1, 0), min(cy + 2, h)):
+            row = ny * w
+            for nx in range(max(cx - 1, 0), min(cx + 2, w)):
+                ni = row + nx
+                s = state[ni]
+                if s & blocked:
+                    continue
+                # the REVEALED bit also keeps the cell from being pushed twice
+                state[ni] = s | REVEALED
+                newly.append(ni)
+                if not s & ADJ_MASK:
+                    stack.append(ni)
+    return newly
+
+
+def _format_cell(ch: str) -> str:
+    return f"  {ch:2s}"
+
+
+def _cell_char(s: int, reveal_all: bool = False) -> str:
+    """Terminal glyph for one packed cell state."""
+    if not reveal_all:
+        if s & FLAGGED and not s & REVEALED:
+            return "F"
+        if not s & REVEALED:
+            return "#"
+    if s & MINE:
+        return "*"
+    adj = s >> ADJ_SHIFT
+    return "." if adj == 0 else str(adj)
+
+
+# reveal_all glyph for every state byte, for bytes.translate; counts above 8
+# cannot occur and map to "?"
+_REVEAL_ALL_GLYPHS = bytes(
+    ord(_cell_char(s, True)) if s >> ADJ_SHIFT <= 8 else ord("?") for s in range(256)
+)
 
 
 class Board:
-    def __init__(self, width: int, height: int, mines: int) -> None:
+    """Board state packed into one byte per cell.
+
+    Cell (x, y) lives at index y * w + x of state; its MINE, REVEALED and
+    FLAGGED bits and adjacent mine count ((s & ADJ_MASK) >> ADJ_SHIFT) share
+    that byte.
+    """
+
+    def __init__(self, width: int, height: int, mines: int, seed: Optional[int] = None) -> None:
         if width <= 0 or height <= 0:
             raise ValueError("width and height must be positive")
         max_mines = width * height - 1  # leave at least one safe
@@ -39,87 +96,164 @@ class Board:
         self.w = width
         self.h = height
         self.mine_target = mines
-        self.grid: List[List[Cell]] = [[Cell() for _ in range(width)] for _ in range(height)]
+        self.rng = random.Random(seed)
+        self.state = bytearray(width * height)
+        # zero-region label per cell (0 = not a zero cell) and, per label, the
+        # flat indices of the region's cells plus its numbered border
+        self._zero_label: List[int] = []
+        self._zero_regions: List[Tuple[int, ...]] = []
         self.mines_placed = False
         self.revealed_count = 0
+        self.flag_count = 0
+        # coordinates newly revealed by the most recent reveal() call
+        self.last_revealed: List[Tuple[int, int]] = []
+        # preformatted render pieces; _cells[y][x] is refreshed on every change
+        self._header = "   " + " ".join(f"{x:2d}" for x in range(width))
+        self._row_labels = [f"{y:2d}" for y in range(height)]
+        self._cells: List[List[str]] = [[_format_cell("#")] * width for _ in range(height)]
+        # reveal_all view; fixed once mines are placed, so built at most once
+        self._final_render: Optional[str] = None
+        # neighbor coordinates of every cell, indexed by y * w + x
+        self._neighbors: List[Tuple[Tuple[int, int], ...]] = [
+            tuple(
+                (x + dx, y + dy)
+                for dy in (-1, 0, 1)
+                for dx in (-1, 0, 1)
+                if (dx or dy) and 0 <= x + dx < width and 0 <= y + dy < height
+            )
+            for y in range(height)
+            for x in range(width)
+        ]
 
     def in_bounds(self, x: int, y: int) -> bool:
         return 0 <= x < self.w and 0 <= y < self.h
 
-    def neighbors(self, x: int, y: int) -> Iterable[Tuple[int, int]]:
-        for dy in (-1, 0, 1):
-            for dx in (-1, 0, 1):
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if self.in_bounds(nx, ny):
-                    yield nx, ny
+    def index(self, x: int, y: int) -> int:
+        return y * self.w + x
+
+    def neighbors(self, x: int, y: int) -> Tuple[Tuple[int, int], ...]:
+        return self._neighbors[y * self.w + x]
 
     def place_mines_excluding(self, safe_x: int, safe_y: int) -> None:
         """Place mines randomly, avoiding the first clicked cell and its neighbors for fairness."""
-        all_coords = [(x, y) for y in range(self.h) for x in range(self.w)]
+        state = self.state
         # Exclude the safe cell and its neighbors
-        excluded = {(safe_x, safe_y), *self.neighbors(safe_x, safe_y)}
-        candidates = [c for c in all_coords if c not in excluded]
-        if len(candidates) < self.mine_target:
+        excluded = sorted(
+            ny * self.w + nx for nx, ny in (*self.neighbors(safe_x, safe_y), (safe_x, safe_y))
+        )
+        if self.w * self.h - len(excluded) < self.mine_target:
             # Fallback: if board is very small, at least exclude the first cell
-            candidates = [(x, y) for (x, y) in all_coords if (x, y) != (safe_x, safe_y)]
-        mines = random.sample(candidates, self.mine_target)
-        for x, y in mines:
-            self.grid[y][x].mine = True
-        # compute adjacencies
-        for y in range(self.h):
-            for x in range(self.w):
-                if self.grid[y][x].mine:
-                    continue
-                self.grid[y][x].adj = sum(1 for nx, ny in self.neighbors(x, y) if self.grid[ny][nx].mine)
+            excluded = [safe_y * self.w + safe_x]
+        # Sample ranks among the non-excluded cells, then shift each rank past
+        # the excluded indices below it to get a flat board index.
+        mines = []
+        for i in self.rng.sample(range(self.w * self.h - len(excluded)), self.mine_target):
+            for e in excluded:
+                if i < e:
+                    break
+                i += 1
+            state[i] |= MINE
+            mines.append(i)
+        # compute adjacencies by scattering each mine onto its neighbors;
+        # mine cells themselves keep adj == 0
+        for i in mines:
+            y, x = divmod(i, self.w)
+            for nx, ny in self.neighbors(x, y):
+                ni = ny * self.w + nx
+                if not state[ni] & MINE:
+                    state[ni] += 1 << ADJ_SHIFT
+        self._label_zero_regions()
         self.mines_placed = True
 
+    def _label_zero_regions(self) -> None:
+        """Label the 8-connected regions of zero cells once mines are placed.
+
+        Each region is stored with its border of numbered cells, i.e. exactly
+        what a flood fill from any of its cells would uncover on a flag-free
+        board.
+        """
+        state = self.state
+        self._zero_label = label = [0] * (self.w * self.h)
+        self._zero_regions = regions = []
+        for start in range(self.w * self.h):
+            if label[start] or state[start] & (MINE | ADJ_MASK):
+                continue
+            n = len(regions) + 1
+            label[start] = n
+            cells = [start]
+            border = set()
+            stack = [start]
+            while stack:
+                cy, cx = divmod(stack.pop(), self.w)
+                for nx, ny in self.neighbors(cx, cy):
+                    ni = ny * self.w + nx
+                    if state[ni] & ADJ_MASK:
+                        border.add(ni)
+                    elif not label[ni]:
+                        label[ni] = n
+                        cells.append(ni)
+                        stack.append(ni)
+            regions.append(tuple(cells) + tuple(border))
+
     def reveal(self, x: int, y: int) -> Tuple[bool, bool]:
         """Reveal a cell. Returns (ok, hit_mine). ok=False if invalid move.
-        Performs flood fill for zero-adjacent cells.
+        Performs flood fill for zero-adjacent cells; the cells it uncovered
+        are left in last_revealed.
         """
+        result = self._reveal(x, y)
+        for cx, cy in self.last_revealed:
+            self._update_cell(cx, cy)
+        return result
+
+    def _update_cell(self, x: int, y: int) -> None:
+        self._cells[y][x] = _format_cell(_cell_char(self.state[y * self.w + x]))
+
+    def _reveal(self, x: int, y: int) -> Tuple[bool, bool]:
+        self.last_revealed = []
         if not self.in_bounds(x, y):
             return False, False
-        cell = self.grid[y][x]
-        if cell.flagged:
+        state = self.state
+        i = y * self.w + x
+        if state[i] & FLAGGED:
             return False, False
-        if cell.revealed:
+        if state[i] & REVEALED:
             # Idempotent reveal: allowed and not a mine
             return True, False
         if not self.mines_placed:
             self.place_mines_excluding(x, y)
-        cell.revealed = True
+        state[i] |= REVEALED
         self.revealed_count += 1
-        if cell.mine:
+        self.last_revealed.append((x, y))
+        if state[i] & MINE:
             return True, True
-        if cell.adj == 0:
-            # flood fill
-            stack = [(x, y)]
-            visited = set(stack)
-            while stack:
-                cx, cy = stack.pop()
-                for nx, ny in self.neighbors(cx, cy):
-                    ncell = self.grid[ny][nx]
-                    if ncell.revealed or ncell.flagged:
-                        continue
-                    if ncell.mine:
-                        continue
-                    ncell.revealed = True
-                    if (nx, ny) not in visited:
-                        visited.add((nx, ny))
-                    self.revealed_count += 1
-                    if ncell.adj == 0:
-                        stack.append((nx, ny))
+        if not state[i] & ADJ_MASK:
+            region = self._zero_regions[self._zero_label[i] - 1]
+            if not any(state[j] & FLAGGED for j in region):
+                # uncover the precomputed region and its border in one pass
+                for j in region:
+                    if not state[j] & REVEALED:
+                        state[j] |= REVEALED
+                        self.revealed_count += 1
+                        ry, rx = divmod(j, self.w)
+                        self.last_revealed.append((rx, ry))
+                return True, False
+            # flags may cut the region apart, so flood fill around them
+            newly = flood_fill(state, self.w, self.h, x, y)
+            self.revealed_count += len(newly)
+            for j in newly:
+                ry, rx = divmod(j, self.w)
+                self.last_revealed.append((rx, ry))
         return True, False
 
     def toggle_flag(self, x: int, y: int) -> bool:
         if not self.in_bounds(x, y):
             return False
-        cell = self.grid[y][x]
-        if cell.revealed:
+        i = y * self.w + x
+        if self.state[i] & REVEALED:
             return False
-        cell.flagged = not cell.flagged
+        self.state[i] ^= FLAGGED
+        self.flag_count += 1 if self.state[i] & FLAGGED else -1
+        self._update_cell(x, y)
         return True
 
     def all_safe_revealed(self) -> bool:
@@ -127,40 +261,30 @@ class Board:
         return self.revealed_count == total_cells - self.mine_target
 
     def render(self, reveal_all: bool = False) -> str:
-        # header
-        header = "   " + " ".join(f"{x:2d}" for x in range(self.w))
-        lines = [header]
+        if reveal_all:
+            if not self.mines_placed:
+                return self._build_final_render()
+            if self._final_render is None:
+                self._final_render = self._build_final_render()
+            return self._final_render
+        lines = [self._header]
+        for label, cells in zip(self._row_labels, self._cells):
+            lines.append(label + "".join(cells))
+        return "\n".join(lines)
+
+    def _build_final_render(self) -> str:
+        # Map every state byte to its glyph in one pass, then lay out rows
+        # exactly as _format_cell would ("  c " per cell).
+        glyphs = self.state.translate(_REVEAL_ALL_GLYPHS).decode("ascii")
+        lines = [self._header]
         for y in range(self.h):
-            row = [f"{y:2d}"]
-            for x in range(self.w):
-                c = self.grid[y][x]
-                ch = "#"
-                if reveal_all:
-                    if c.mine:
-                        ch = "*"
-                    elif c.adj == 0:
-                        ch = "."
-                    else:
-                        ch = str(c.adj)
-                else:
-                    if c.flagged and not c.revealed:
-                        ch = "F"
-                    elif not c.revealed:
-                        ch = "#"
-                    else:
-                        if c.mine:
-                            ch = "*"
-                        elif c.adj == 0:
-                            ch = "."
-                        else:
-                            ch = str(c.adj)
-                row.append(f" {ch:2s}")
-            lines.append(" ".join(row))
+            row = glyphs[y * self.w:(y + 1) * self.w]
+            lines.append(self._row_labels[y] + "  " + "   ".join(row) + " ")
         return "\n".join(lines)
 
 
 def parse_args() -> argparse.Namespace:
-    choices = ", ".join(sorted(list_difficulties().keys()))
+    choices = ", ".join(difficulty_names())
     p = argparse.ArgumentParser(description=f"Minisweeper - tiny terminal Minesweeper. Difficulties: {choices}")
     p.add_argument("--width", type=int, default=9, help="Board width (overridden by --difficulty)")
     p.add_argument("--height", type=int, default=9, help="Board height (overridden by --difficulty)")
@@ -179,7 +303,6 @@ def print_help() -> None:
 
 def main() -> None:
     ns = parse_args()
-    random.seed()
     if ns.difficulty:
         diff = get_difficulty(ns.difficulty)
         w, h, m = diff.width, diff.height, diff.mines